@@ -53,21 +53,29 @@ fn monomorphize(ctx: &ReportContext, program: Program) -> Program {
 
 fn collectFiles(input: &Path) -> Vec<String> {
     let mut allFiles = Vec::new();
-    if input.is_dir() {
-        for entry in fs::read_dir(input).expect("Failed to read directory") {
+    if !input.is_dir() {
+        allFiles.push(format!("{}", input.display()));
+        return allFiles;
+    }
+    // iterative walk with an explicit worklist, deeply nested source trees
+    // should not be limited by the call stack
+    let mut pending = vec![input.to_path_buf()];
+    while let Some(dir) = pending.pop() {
+        let mut subDirs = Vec::new();
+        for entry in fs::read_dir(&dir).expect("Failed to read directory") {
             let entry = entry.expect("Failed to read entry");
             let path = entry.path();
 
             if path.is_dir() {
-                allFiles.extend(collectFiles(&path));
+                subDirs.push(path);
             } else if let Some(extension) = path.extension() {
                 if extension == "sk" {
                     allFiles.push(format!("{}", path.display()));
                 }
             }
         }
-    } else {
-        allFiles.push(format!("{}", input.display()));
+        subDirs.reverse();
+        pending.extend(subDirs);
     }
     allFiles
 }
@@ -1,5 +1,3 @@
-use std::collections::BTreeSet;
-
 use crate::siko::{
     hir::{
         Function::{BlockId, Function},
@@ -9,32 +7,31 @@ use crate::siko::{
     location::Report::{Report, ReportContext},
 };
 
-pub fn eliminateDeadCode(ctx: &ReportContext, program: Program) -> Program {
-    let mut result = program.clone();
-    for (name, f) in &program.functions {
-        let mut eliminator = DeadCodeEliminator::new(f);
+pub fn eliminateDeadCode(ctx: &ReportContext, mut program: Program) -> Program {
+    let functions = std::mem::take(&mut program.functions);
+    for (name, f) in functions {
+        let mut eliminator = DeadCodeEliminator::new(&f);
         let f = eliminator.process(ctx);
-        result.functions.insert(name.clone(), f);
+        program.functions.insert(name, f);
     }
-    result
-}
-
-#[derive(PartialEq, Eq, PartialOrd, Ord, Debug)]
-struct InstructionId {
-    block: usize,
-    id: usize,
+    program
 }
 
 pub struct DeadCodeEliminator<'a> {
     function: &'a Function,
-    visited: BTreeSet<InstructionId>,
+    // per block visited flags, indexed by block id and instruction index
+    visited: Vec<Vec<bool>>,
 }
 
 impl<'a> DeadCodeEliminator<'a> {
     pub fn new(f: &'a Function) -> DeadCodeEliminator<'a> {
+        let visited = match &f.body {
+            Some(body) => body.blocks.iter().map(|b| vec![false; b.instructions.len()]).collect(),
+            None => Vec::new(),
+        };
         DeadCodeEliminator {
             function: f,
-            visited: BTreeSet::new(),
+            visited: visited,
         }
     }
 
@@ -45,12 +42,8 @@ impl<'a> DeadCodeEliminator<'a> {
         if let Some(body) = &self.function.body {
             for (blockIndex, block) in body.blocks.iter().enumerate() {
                 for (index, instruction) in block.instructions.iter().enumerate() {
-                    if !self.visited.contains(&InstructionId {
-                        block: blockIndex,
-                        id: index,
-                    }) {
+                    if !self.visited[blockIndex][index] {
                         if !instruction.implicit {
-                            println!("unreachable code {}", instruction);
                             let slogan = format!("Unreachable code");
                             let r = Report::new(ctx, slogan, Some(instruction.location.clone()));
                             r.print();
@@ -62,20 +55,12 @@ impl<'a> DeadCodeEliminator<'a> {
         let mut result = self.function.clone();
         if let Some(body) = &mut result.body {
             for (blockIndex, block) in body.blocks.iter_mut().enumerate() {
-                let instructions: Vec<_> = block
-                    .instructions
-                    .iter()
-                    .cloned()
-                    .enumerate()
-                    .filter(|(index, _)| {
-                        self.visited.contains(&InstructionId {
-                            block: blockIndex,
-                            id: *index,
-                        })
-                    })
-                    .map(|(_, i)| i.clone())
-                    .collect();
-                block.instructions = instructions;
+                let mut index = 0;
+                block.instructions.retain(|_| {
+                    let keep = self.visited[blockIndex][index];
+                    index += 1;
+                    keep
+                });
             }
         }
         result
@@ -84,13 +69,11 @@ impl<'a> DeadCodeEliminator<'a> {
     fn processBlock(&mut self, blockId: BlockId) {
         let block = self.function.getBlockById(blockId);
         for (index, instruction) in block.instructions.iter().enumerate() {
-            let added = self.visited.insert(InstructionId {
-                block: blockId.id as usize,
-                id: index,
-            });
-            if !added {
+            let visited = &mut self.visited[blockId.id as usize][index];
+            if *visited {
                 return;
             }
+            *visited = true;
             match &instruction.kind {
                 InstructionKind::FunctionCall(dest, _, _) => {
                     if dest.getType().isNever() {
@@ -1,5 +1,5 @@
 use std::{
-    collections::{BTreeMap, BTreeSet},
+    collections::{BTreeMap, BTreeSet, VecDeque},
     fmt::Display,
 };
 
@@ -23,16 +23,19 @@ use crate::siko::{
     util::DependencyProcessor,
 };
 
-pub fn checkDrops(ctx: &ReportContext, program: Program) -> Program {
-    let mut result = program.clone();
-    for (name, f) in &program.functions {
-        let mut checker = DropChecker::new(f, ctx, &program);
+pub fn checkDrops(ctx: &ReportContext, mut program: Program) -> Program {
+    // the same types show up in collisions across functions, resolve the Copy
+    // instance for each type only once
+    let mut copyCache = BTreeMap::new();
+    let functions = std::mem::take(&mut program.functions);
+    for (name, f) in functions {
+        let mut checker = DropChecker::new(&f, ctx, &program, &mut copyCache);
         //println!("Checking drops for {}", name);
         checker.processDeps();
         let f = checker.process();
-        result.functions.insert(name.clone(), f);
+        program.functions.insert(name, f);
     }
-    result
+    program
 }
 
 #[derive(PartialEq, Eq, PartialOrd, Ord, Debug)]
@@ -75,49 +78,36 @@ impl Display for Usage {
     }
 }
 
+// the open blocks always form a single chain, store them as a flat stack of
+// ids instead of a nested structure walked recursively on every operation
 #[derive(Clone, PartialEq, Eq, PartialOrd, Ord)]
 struct SyntaxBlock {
-    id: String,
-    childBlocks: Vec<SyntaxBlock>,
+    ids: Vec<String>,
 }
 
 impl SyntaxBlock {
     fn new(id: String) -> SyntaxBlock {
-        SyntaxBlock {
-            id: id,
-            childBlocks: Vec::new(),
-        }
+        SyntaxBlock { ids: vec![id] }
     }
 
-    fn addBlock(&mut self, block: SyntaxBlock) {
-        if self.childBlocks.is_empty() {
-            self.childBlocks.push(block);
-        } else {
-            self.childBlocks.last_mut().unwrap().addBlock(block);
-        }
+    fn addBlock(&mut self, id: String) {
+        self.ids.push(id);
     }
 
     fn getCurrentBlockId(&self) -> String {
-        if self.childBlocks.is_empty() {
-            return format!("{}", self.id);
-        } else {
-            return format!("{}.{}", self.id, self.childBlocks.last().unwrap().getCurrentBlockId());
-        }
+        self.ids.join(".")
     }
 
     fn endBlock(&mut self) {
-        assert!(!self.childBlocks.is_empty());
-        if self.childBlocks.last().unwrap().childBlocks.is_empty() {
-            self.childBlocks.pop();
-        } else {
-            self.childBlocks.last_mut().unwrap().endBlock();
-        }
+        assert!(self.ids.len() > 1);
+        self.ids.pop();
     }
 }
 
 #[derive(Clone, PartialEq, Eq, PartialOrd, Ord)]
 struct Context {
     live: Vec<Variable>,
+    liveNames: BTreeSet<VariableName>,
     usages: Vec<Usage>,
     rootBlock: SyntaxBlock,
 }
@@ -172,18 +162,14 @@ impl Context {
         let rootBlock = SyntaxBlock::new(format!("0"));
         Context {
             live: Vec::new(),
+            liveNames: BTreeSet::new(),
             usages: Vec::new(),
             rootBlock,
         }
     }
 
     fn isLive(&self, var: &VariableName) -> bool {
-        for v in &self.live {
-            if v.value == *var {
-                return true;
-            }
-        }
-        false
+        self.liveNames.contains(var)
     }
 
     fn addLive(&mut self, var: &Variable) {
@@ -192,7 +178,9 @@ impl Context {
         //     var.value,
         //     self.rootBlock.getCurrentBlockId()
         // );
-        if !self.live.contains(var) {
+        // the live list keeps declaration order for drop generation, the
+        // name set makes the membership checks cheap
+        if self.liveNames.insert(var.value.clone()) {
             self.live.push(var.clone());
         }
         self.usages.retain(|usage| usage.path.root.value != var.value);
@@ -318,9 +306,15 @@ impl Path {
     }
 
     fn add(&self, item: String) -> Path {
-        let mut p = self.clone();
-        p.items.push(item);
-        p
+        // size the new item list exactly, cloning and then pushing reallocated
+        // the freshly cloned buffer on every extension
+        let mut items = Vec::with_capacity(self.items.len() + 1);
+        items.extend(self.items.iter().cloned());
+        items.push(item);
+        Path {
+            root: self.root.clone(),
+            items: items,
+        }
     }
 
     fn userPath(&self) -> String {
@@ -419,10 +413,17 @@ pub struct DropChecker<'a> {
     usages: BTreeMap<Variable, Usage>,
     assigns: BTreeMap<Tag, DropList>,
     returns: BTreeMap<Variable, DropList>,
+    copyCache: &'a mut BTreeMap<Type, bool>,
+    fieldTypeCache: BTreeMap<(Type, String), Type>,
 }
 
 impl<'a> DropChecker<'a> {
-    pub fn new(f: &'a Function, ctx: &'a ReportContext, program: &'a Program) -> DropChecker<'a> {
+    pub fn new(
+        f: &'a Function,
+        ctx: &'a ReportContext,
+        program: &'a Program,
+        copyCache: &'a mut BTreeMap<Type, bool>,
+    ) -> DropChecker<'a> {
         DropChecker {
             ctx: ctx,
             bodyBuilder: BodyBuilder::cloneFunction(f),
@@ -438,6 +439,8 @@ impl<'a> DropChecker<'a> {
             usages: BTreeMap::new(),
             assigns: BTreeMap::new(),
             returns: BTreeMap::new(),
+            copyCache: copyCache,
+            fieldTypeCache: BTreeMap::new(),
         }
     }
 
@@ -451,11 +454,12 @@ impl<'a> DropChecker<'a> {
                     let mut kinds = Vec::new();
                     for var in vars {
                         if self.implicitClones.contains(&var) {
-                            let mut implicitRefDest = self
-                                .bodyBuilder
-                                .createTempValue(VariableName::DropImplicitCloneRef, instruction.location.clone());
                             let ty = Type::Reference(Box::new(var.getType().clone()), None);
-                            implicitRefDest.ty = Some(ty);
+                            let implicitRefDest = self.bodyBuilder.createTypedTempValue(
+                                VariableName::DropImplicitCloneRef,
+                                ty,
+                                instruction.location.clone(),
+                            );
                             let implicitRefKind = InstructionKind::Ref(implicitRefDest.clone(), var.clone());
 
                             let mut implicitCloneDest = self
@@ -544,7 +548,13 @@ impl<'a> DropChecker<'a> {
             }
 
             //println!("collision {} {}", prevUsage.var, currentUsage.var);
-            if self.program.instanceResolver.isCopy(prevUsage.var.getType()) {
+            let ty = prevUsage.var.getType();
+            let program = self.program;
+            let isCopy = *self
+                .copyCache
+                .entry(ty.clone())
+                .or_insert_with(|| program.instanceResolver.isCopy(ty));
+            if isCopy {
                 //println!("implict clone for {}", prevUsage.var);
                 self.implicitClones.insert(prevUsage.var.clone());
                 prevUsage.kind = UsageKind::Ref;
@@ -591,9 +601,7 @@ impl<'a> DropChecker<'a> {
         self.processCollision();
         self.addImplicitClone();
         self.generateDrops();
-        let mut result = self.function.clone();
-        result.body = Some(self.bodyBuilder.build());
-        result
+        self.function.copyWithBody(Some(self.bodyBuilder.build()))
     }
 
     fn processDropList(&mut self, dropList: DropList, builder: &mut BlockBuilder, location: Location) {
@@ -604,7 +612,12 @@ impl<'a> DropChecker<'a> {
             let mut currentTy = receiver.getType().clone();
 
             for item in &path.items {
-                if let Some(className) = currentTy.getName() {
+                // walking a drop path instantiated the class again for every
+                // element of the field chain, remember the resolved field types
+                let key = (currentTy.clone(), item.clone());
+                if let Some(fieldTy) = self.fieldTypeCache.get(&key) {
+                    currentTy = fieldTy.clone();
+                } else if let Some(className) = currentTy.getName() {
                     if let Some(classDef) = self.program.getClass(&className) {
                         let mut allocator = TypeVarAllocator::new();
                         let classInstance = instantiateClass(&mut allocator, &classDef, &currentTy);
@@ -614,13 +627,13 @@ impl<'a> DropChecker<'a> {
                                 break;
                             }
                         }
+                        self.fieldTypeCache.insert(key, currentTy.clone());
                     }
                 }
 
-                let mut dest = self
-                    .bodyBuilder
-                    .createTempValue(VariableName::DropVar, location.clone());
-                dest.ty = Some(currentTy.clone());
+                let mut dest =
+                    self.bodyBuilder
+                        .createTypedTempValue(VariableName::DropVar, currentTy.clone(), location.clone());
 
                 let fieldRefKind = InstructionKind::FieldRef(dest.clone(), receiver, item.clone());
                 kinds.push(fieldRefKind);
@@ -628,10 +641,11 @@ impl<'a> DropChecker<'a> {
                 receiver = dest;
             }
 
-            let mut dropRes = self
-                .bodyBuilder
-                .createTempValue(VariableName::AutoDropResult, location.clone());
-            dropRes.ty = Some(Type::getUnitType());
+            let dropRes = self.bodyBuilder.createTypedTempValue(
+                VariableName::AutoDropResult,
+                Type::getUnitType(),
+                location.clone(),
+            );
 
             let dropKind = InstructionKind::Drop(dropRes, receiver.clone());
 
@@ -796,7 +810,7 @@ impl<'a> DropChecker<'a> {
                             let mut dropList = DropList::new();
                             let mut path = Path::new(dest.clone());
                             for f in fields {
-                                path = path.add(f.name.clone());
+                                path.items.push(f.name.clone());
                             }
                             let mut parent = path.clone();
                             parent.items.pop();
@@ -836,8 +850,7 @@ impl<'a> DropChecker<'a> {
                         self.checkMove(&mut context, root, getUsageKind(root));
                     }
                     InstructionKind::BlockStart(name) => {
-                        let block = SyntaxBlock::new(name.id.clone());
-                        context.rootBlock.addBlock(block);
+                        context.rootBlock.addBlock(name.id.clone());
                         //println!("block start {}", context.rootBlock.getCurrentBlockId());
                     }
                     InstructionKind::BlockEnd(endId) => {
@@ -910,33 +923,47 @@ impl<'a> DropChecker<'a> {
     }
 
     fn processGroup(&mut self, items: &Vec<BlockId>, blockDeps: &BTreeMap<BlockId, Vec<BlockId>>) {
-        loop {
-            let mut changed = false;
-            for item in items {
-                //println!("processing block {}", item);
-                let deps = blockDeps.get(item).expect("deps not found");
-                let mut mergedContext = Context::new();
-                let mut empty = !deps.is_empty();
-                for dep in deps {
-                    if let Some(terminalContext) = self.terminalContexts.get(dep) {
-                        mergedContext.merge(terminalContext);
-                        empty = false;
-                    } else {
-                        if !items.contains(dep) {
-                            panic!("terminal context not found for {}", dep);
-                        }
+        let itemSet: BTreeSet<BlockId> = items.iter().cloned().collect();
+        // worklist fixed point, only the dependents of a block whose terminal
+        // context changed are reprocessed instead of sweeping the whole group
+        // every round
+        let mut dependents: BTreeMap<BlockId, Vec<BlockId>> = BTreeMap::new();
+        for item in items {
+            let deps = blockDeps.get(item).expect("deps not found");
+            for dep in deps {
+                dependents.entry(dep.clone()).or_default().push(item.clone());
+            }
+        }
+        let mut queue: VecDeque<BlockId> = items.iter().cloned().collect();
+        let mut queued = itemSet.clone();
+        while let Some(item) = queue.pop_front() {
+            queued.remove(&item);
+            //println!("processing block {}", item);
+            let deps = blockDeps.get(&item).expect("deps not found");
+            let mut mergedContext = Context::new();
+            let mut empty = !deps.is_empty();
+            for dep in deps {
+                if let Some(terminalContext) = self.terminalContexts.get(dep) {
+                    mergedContext.merge(terminalContext);
+                    empty = false;
+                } else {
+                    if !itemSet.contains(dep) {
+                        panic!("terminal context not found for {}", dep);
                     }
                 }
-                if empty {
-                    continue;
-                }
-                //println!("merged context {}", mergedContext);
-                if self.processBlock(item.clone(), mergedContext) {
-                    changed = true;
-                }
             }
-            if !changed {
-                break;
+            if empty {
+                continue;
+            }
+            //println!("merged context {}", mergedContext);
+            if self.processBlock(item.clone(), mergedContext) {
+                if let Some(deps) = dependents.get(&item) {
+                    for dep in deps {
+                        if itemSet.contains(dep) && queued.insert(dep.clone()) {
+                            queue.push_back(dep.clone());
+                        }
+                    }
+                }
             }
         }
     }
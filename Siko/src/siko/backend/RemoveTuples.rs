@@ -53,6 +53,12 @@ impl RemoveTuples for Parameter {
     }
 }
 
+impl<T: RemoveTuples> RemoveTuples for Box<T> {
+    fn removeTuples(&self, ctx: &mut Context) -> Self {
+        Box::new(self.as_ref().removeTuples(ctx))
+    }
+}
+
 impl<T: RemoveTuples> RemoveTuples for Option<T> {
     fn removeTuples(&self, ctx: &mut Context) -> Self {
         match self {
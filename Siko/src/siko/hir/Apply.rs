@@ -35,17 +35,23 @@ impl Apply for Type {
             Type::Function(args, fnResult) => {
                 let newArgs = args.iter().map(|arg| arg.apply(sub)).collect();
                 let newFnResult = fnResult.apply(sub);
-                Type::Function(newArgs, Box::new(newFnResult))
+                Type::Function(newArgs, newFnResult)
             }
             Type::Var(_) => sub.get(self.clone()),
-            Type::Reference(arg, l) => Type::Reference(Box::new(arg.apply(sub)), l.clone()),
-            Type::Ptr(arg) => Type::Ptr(Box::new(arg.apply(sub))),
+            Type::Reference(arg, l) => Type::Reference(arg.apply(sub), l.clone()),
+            Type::Ptr(arg) => Type::Ptr(arg.apply(sub)),
             Type::SelfType => self.clone(),
             Type::Never(_) => self.clone(),
         }
     }
 }
 
+impl<T: Apply> Apply for Box<T> {
+    fn apply(&self, sub: &TypeSubstitution) -> Self {
+        Box::new(self.as_ref().apply(sub))
+    }
+}
+
 impl<T: Apply> Apply for Option<T> {
     fn apply(&self, sub: &TypeSubstitution) -> Self {
         match self {
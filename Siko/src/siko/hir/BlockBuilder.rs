@@ -181,8 +181,9 @@ impl BlockBuilder {
         location: Location,
         ty: Type,
     ) -> Variable {
-        let mut result = self.bodyBuilder.createTempValue(VariableName::Call, location.clone());
-        result.ty = Some(ty);
+        let result = self
+            .bodyBuilder
+            .createTypedTempValue(VariableName::Call, ty, location.clone());
         self.addInstruction(
             InstructionKind::FunctionCall(result.clone(), functionName, args),
             location,
@@ -226,10 +227,9 @@ impl BlockBuilder {
     }
 
     pub fn addTypedFieldRef(&mut self, receiver: Variable, field: String, location: Location, ty: Type) -> Variable {
-        let mut result = self
+        let result = self
             .bodyBuilder
-            .createTempValue(VariableName::FieldRef, location.clone());
-        result.ty = Some(ty);
+            .createTypedTempValue(VariableName::FieldRef, ty, location.clone());
         self.addInstruction(
             InstructionKind::FieldRef(result.clone(), receiver, field),
             location.clone(),
@@ -268,8 +268,9 @@ impl BlockBuilder {
     }
 
     pub fn addUnit(&mut self, location: Location) -> Variable {
-        let mut result = self.bodyBuilder.createTempValue(VariableName::Unit, location.clone());
-        result.ty = Some(Type::getUnitType());
+        let result = self
+            .bodyBuilder
+            .createTypedTempValue(VariableName::Unit, Type::getUnitType(), location.clone());
         self.addInstruction(InstructionKind::Tuple(result.clone(), Vec::new()), location.clone());
         result
     }
@@ -292,10 +293,9 @@ impl BlockBuilder {
     }
 
     pub fn addTypedTupleIndex(&mut self, tuple: Variable, index: i32, location: Location, ty: Type) -> Variable {
-        let mut result = self
+        let result = self
             .bodyBuilder
-            .createTempValue(VariableName::TupleIndex, location.clone());
-        result.ty = Some(ty);
+            .createTypedTempValue(VariableName::TupleIndex, ty, location.clone());
         self.addInstruction(
             InstructionKind::TupleIndex(result.clone(), tuple, index),
             location.clone(),
@@ -336,10 +336,9 @@ impl BlockBuilder {
     }
 
     pub fn addTypedTransform(&mut self, value: Variable, index: u32, location: Location, ty: Type) -> Variable {
-        let mut result = self
+        let result = self
             .bodyBuilder
-            .createTempValue(VariableName::Transform, location.clone());
-        result.ty = Some(ty);
+            .createTypedTempValue(VariableName::Transform, ty, location.clone());
         self.addInstruction(
             InstructionKind::Transform(result.clone(), value, index),
             location.clone(),
@@ -150,6 +150,16 @@ impl Builder {
             index: 0,
         }
     }
+
+    pub fn createTypedTempValue(&mut self, name: fn(u32) -> VariableName, ty: Type, location: Location) -> Variable {
+        let valueId = self.getNextId();
+        Variable {
+            value: name(valueId),
+            location: location,
+            ty: Some(Box::new(ty)),
+            index: 0,
+        }
+    }
 }
 
 #[derive(Clone)]
@@ -264,6 +274,11 @@ impl BodyBuilder {
         bodyBuilder.createTempValue(name, location)
     }
 
+    pub fn createTypedTempValue(&mut self, name: fn(u32) -> VariableName, ty: Type, location: Location) -> Variable {
+        let mut bodyBuilder = self.bodyBuilder.borrow_mut();
+        bodyBuilder.createTypedTempValue(name, ty, location)
+    }
+
     pub fn getInstruction(&self, id: BlockId, index: usize) -> Option<Instruction> {
         let bodyBuilder = self.bodyBuilder.borrow();
         bodyBuilder.getInstruction(id, index)
@@ -196,7 +196,9 @@ impl Debug for VariableName {
 pub struct Variable {
     pub value: VariableName,
     pub location: Location,
-    pub ty: Option<Type>,
+    // boxed, variables are embedded in every instruction and the inline type
+    // tripled the size of the whole instruction enum
+    pub ty: Option<Box<Type>>,
     pub index: u32,
 }
 
@@ -412,6 +414,17 @@ impl Function {
         }
     }
 
+    pub fn copyWithBody(&self, body: Option<Body>) -> Function {
+        Function {
+            name: self.name.clone(),
+            params: self.params.clone(),
+            result: self.result.clone(),
+            body: body,
+            constraintContext: self.constraintContext.clone(),
+            kind: self.kind.clone(),
+        }
+    }
+
     pub fn getBlockById(&self, id: BlockId) -> &Block {
         if let Some(body) = &self.body {
             body.getBlockById(id)
@@ -6,46 +6,89 @@ use std::{
 use super::{
     Apply::{Apply, ApplyVariable},
     Function::Variable,
-    Type::Type,
+    Type::{Type, TypeVar},
     Unification::unify,
 };
 
 #[derive(Debug)]
 pub struct TypeSubstitution {
-    substitutions: BTreeMap<Type, Type>,
+    // allocator vars are dense, their bindings live in a slot per var;
+    // named vars from generics are rare and stay in a map
+    vars: Vec<Option<Type>>,
+    named: BTreeMap<String, Type>,
 }
 
 impl TypeSubstitution {
     pub fn new() -> TypeSubstitution {
         TypeSubstitution {
-            substitutions: BTreeMap::new(),
+            vars: Vec::new(),
+            named: BTreeMap::new(),
         }
     }
 
     pub fn add(&mut self, old: Type, new: Type) {
         assert_ne!(old, new);
-        self.substitutions.insert(old, new);
+        match old {
+            Type::Var(TypeVar::Var(v)) => {
+                let index = v as usize;
+                if index >= self.vars.len() {
+                    self.vars.resize(index + 1, None);
+                }
+                self.vars[index] = Some(new);
+            }
+            Type::Var(TypeVar::Named(n)) => {
+                self.named.insert(n, new);
+            }
+            old => panic!("substitution key is not a type var {}", old),
+        }
+    }
+
+    fn lookup(&self, ty: &Type) -> Option<&Type> {
+        match ty {
+            Type::Var(TypeVar::Var(v)) => self.vars.get(*v as usize).and_then(|ty| ty.as_ref()),
+            Type::Var(TypeVar::Named(n)) => self.named.get(n),
+            _ => None,
+        }
     }
 
     pub fn get(&self, old: Type) -> Type {
-        match self.substitutions.get(&old) {
-            Some(new) => new.apply(self),
-            None => old,
+        // walk chained substitutions iteratively instead of re-applying the
+        // whole substitution on every hop, only the final type needs a full apply
+        let mut current = &old;
+        let mut hopped = false;
+        while let Some(new) = self.lookup(current) {
+            current = new;
+            hopped = true;
+        }
+        if hopped {
+            current.apply(self)
+        } else {
+            old
         }
     }
 }
 
 impl Display for TypeSubstitution {
     fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
-        print!("[");
-        for (index, (key, value)) in self.substitutions.iter().enumerate() {
-            if index == 0 {
-                write!(f, "{}: {}", key, value)?;
-            } else {
-                write!(f, ", {}: {}", key, value)?;
+        write!(f, "[")?;
+        let mut first = true;
+        for (index, ty) in self.vars.iter().enumerate() {
+            if let Some(ty) = ty {
+                if !first {
+                    write!(f, ", ")?;
+                }
+                write!(f, "#{}: {}", index, ty)?;
+                first = false;
+            }
+        }
+        for (name, ty) in &self.named {
+            if !first {
+                write!(f, ", ")?;
             }
+            write!(f, "{}: {}", name, ty)?;
+            first = false;
         }
-        print!("]");
+        write!(f, "]")?;
         Ok(())
     }
 }
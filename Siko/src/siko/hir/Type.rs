@@ -1,4 +1,4 @@
-use std::{collections::BTreeSet, fmt::Display};
+use std::{collections::BTreeSet, fmt::Display, sync::LazyLock};
 
 use crate::siko::qualifiedname::{
     getBoolTypeName, getCharTypeName, getIntTypeName, getStringLiteralTypeName, getStringTypeName, QualifiedName,
@@ -6,6 +6,14 @@ use crate::siko::qualifiedname::{
 
 use super::Lifetime::{Lifetime, LifetimeInfo};
 
+// the builtin types are requested all over the compiler, build them once
+static BOOL_TYPE: LazyLock<Type> = LazyLock::new(|| Type::Named(getBoolTypeName(), Vec::new(), None));
+static INT_TYPE: LazyLock<Type> = LazyLock::new(|| Type::Named(getIntTypeName(), Vec::new(), None));
+static STRING_TYPE: LazyLock<Type> = LazyLock::new(|| Type::Named(getStringTypeName(), Vec::new(), None));
+static STRING_LITERAL_TYPE: LazyLock<Type> =
+    LazyLock::new(|| Type::Named(getStringLiteralTypeName(), Vec::new(), None));
+static CHAR_TYPE: LazyLock<Type> = LazyLock::new(|| Type::Named(getCharTypeName(), Vec::new(), None));
+
 #[derive(Debug, Clone, PartialEq, Eq, PartialOrd, Ord)]
 pub enum TypeVar {
     Var(u64),
@@ -25,7 +33,8 @@ impl Display for TypeVar {
 
 #[derive(Debug, Clone, PartialEq, Eq, PartialOrd, Ord)]
 pub enum Type {
-    Named(QualifiedName, Vec<Type>, Option<LifetimeInfo>),
+    // the lifetime info is boxed to keep the common lifetime-less types small
+    Named(QualifiedName, Vec<Type>, Option<Box<LifetimeInfo>>),
     Tuple(Vec<Type>),
     Function(Vec<Type>, Box<Type>),
     Var(TypeVar),
@@ -300,23 +309,23 @@ impl Type {
     }
 
     pub fn getBoolType() -> Type {
-        Type::Named(getBoolTypeName(), Vec::new(), None)
+        BOOL_TYPE.clone()
     }
 
     pub fn getIntType() -> Type {
-        Type::Named(getIntTypeName(), Vec::new(), None)
+        INT_TYPE.clone()
     }
 
     pub fn getStringType() -> Type {
-        Type::Named(getStringTypeName(), Vec::new(), None)
+        STRING_TYPE.clone()
     }
 
     pub fn getStringLiteralType() -> Type {
-        Type::Named(getStringLiteralTypeName(), Vec::new(), None)
+        STRING_LITERAL_TYPE.clone()
     }
 
     pub fn getCharType() -> Type {
-        Type::Named(getCharTypeName(), Vec::new(), None)
+        CHAR_TYPE.clone()
     }
 
     pub fn getUnitType() -> Type {
@@ -324,6 +333,17 @@ impl Type {
     }
 }
 
+fn writeTypes(f: &mut std::fmt::Formatter<'_>, types: &[Type]) -> std::fmt::Result {
+    for (index, ty) in types.iter().enumerate() {
+        if index == 0 {
+            write!(f, "{}", ty)?;
+        } else {
+            write!(f, ", {}", ty)?;
+        }
+    }
+    Ok(())
+}
+
 impl Display for Type {
     fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
         match &self {
@@ -335,17 +355,20 @@ impl Display for Type {
                 if args.is_empty() {
                     write!(f, "{}{}", name, lifetimes)
                 } else {
-                    let args: Vec<String> = args.iter().map(|t| format!("{}", t)).collect();
-                    write!(f, "{}[{}]{}", name, args.join(", "), lifetimes)
+                    write!(f, "{}[", name)?;
+                    writeTypes(f, args)?;
+                    write!(f, "]{}", lifetimes)
                 }
             }
             Type::Tuple(args) => {
-                let args: Vec<String> = args.iter().map(|t| format!("{}", t)).collect();
-                write!(f, "({})", args.join(", "))
+                write!(f, "(")?;
+                writeTypes(f, args)?;
+                write!(f, ")")
             }
             Type::Function(args, result) => {
-                let args: Vec<String> = args.iter().map(|t| format!("{}", t)).collect();
-                write!(f, "fn({}) -> {}", args.join(", "), result)
+                write!(f, "fn(")?;
+                writeTypes(f, args)?;
+                write!(f, ") -> {}", result)
             }
             Type::Var(v) => write!(f, "{}", v),
             Type::Reference(ty, l) => match l {
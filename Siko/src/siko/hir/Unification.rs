@@ -14,6 +14,11 @@ pub fn unify(sub: &mut TypeSubstitution, ty1: &Type, ty2: &Type, allowNamed: boo
     let ty1 = ty1.apply(sub).makeSingleRef();
     let ty2 = ty2.apply(sub).makeSingleRef();
     //println!("Unifying2 {}/{}", ty1, ty2);
+    if ty1 == ty2 {
+        // already unified, skip the structural walk and do not grow the
+        // substitution with self maps
+        return Ok(());
+    }
     match (&ty1, &ty2) {
         (Type::Named(name1, args1, _), Type::Named(name2, args2, _)) => {
             if name1 != name2 {
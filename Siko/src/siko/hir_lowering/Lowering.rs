@@ -17,10 +17,22 @@ use crate::siko::{
     },
     qualifiedname::{
         getBoolTypeName, getFalseName, getI32TypeName, getIntTypeName, getNativePtrToRefName, getTrueName,
-        getU8TypeName,
+        getU8TypeName, QualifiedName,
     },
 };
 
+use std::sync::LazyLock;
+
+// the builtin names used for dispatch during lowering, built once instead of
+// allocating a fresh qualified name per comparison
+static TRUE_NAME: LazyLock<QualifiedName> = LazyLock::new(getTrueName);
+static FALSE_NAME: LazyLock<QualifiedName> = LazyLock::new(getFalseName);
+static NATIVE_PTR_TO_REF_NAME: LazyLock<QualifiedName> = LazyLock::new(getNativePtrToRefName);
+static BOOL_TYPE_NAME: LazyLock<QualifiedName> = LazyLock::new(getBoolTypeName);
+static INT_TYPE_NAME: LazyLock<QualifiedName> = LazyLock::new(getIntTypeName);
+static U8_TYPE_NAME: LazyLock<QualifiedName> = LazyLock::new(getU8TypeName);
+static I32_TYPE_NAME: LazyLock<QualifiedName> = LazyLock::new(getI32TypeName);
+
 pub struct Builder<'a> {
     program: &'a HirProgram,
     function: &'a HirFunction,
@@ -55,7 +67,7 @@ impl<'a> Builder<'a> {
         for instruction in &hirBlock.instructions {
             match &instruction.kind {
                 HirInstructionKind::FunctionCall(dest, name, args) => {
-                    if name.base() == getTrueName() {
+                    if name.base() == *TRUE_NAME {
                         let dest = self.buildVariable(dest);
                         block.instructions.push(Instruction::Declare(dest.clone()));
                         block
@@ -63,7 +75,7 @@ impl<'a> Builder<'a> {
                             .push(Instruction::IntegerLiteral(dest, "1".to_string()));
                         continue;
                     }
-                    if name.base() == getFalseName() {
+                    if name.base() == *FALSE_NAME {
                         let dest = self.buildVariable(dest);
                         block.instructions.push(Instruction::Declare(dest.clone()));
                         block
@@ -71,7 +83,7 @@ impl<'a> Builder<'a> {
                             .push(Instruction::IntegerLiteral(dest, "0".to_string()));
                         continue;
                     }
-                    if name.base() == getNativePtrToRefName() {
+                    if name.base() == *NATIVE_PTR_TO_REF_NAME {
                         let dest = self.buildVariable(dest);
                         let arg = &args[0];
                         block.instructions.push(Instruction::Declare(dest.clone()));
@@ -136,7 +148,7 @@ impl<'a> Builder<'a> {
                     block.instructions.push(Instruction::StringLiteral(dest, v.to_string()));
                 }
                 HirInstructionKind::EnumSwitch(root, cases) => {
-                    if root.getType().getName().unwrap().base() == getBoolTypeName() {
+                    if root.getType().getName().unwrap().base() == *BOOL_TYPE_NAME {
                         let dest = self.buildVariable(root);
                         let mut mirCases = Vec::new();
                         for case in cases {
@@ -173,7 +185,7 @@ impl<'a> Builder<'a> {
                     block.instructions.push(Instruction::IntegerSwitch(root, mirCases));
                 }
                 HirInstructionKind::Transform(dest, root, index) => {
-                    if root.getType().getName().unwrap().base() == getBoolTypeName() {
+                    if root.getType().getName().unwrap().base() == *BOOL_TYPE_NAME {
                         block.instructions.push(Instruction::Declare(self.buildVariable(dest)));
                     } else {
                         let dest = self.buildVariable(dest);
@@ -201,7 +213,7 @@ impl<'a> Builder<'a> {
                 }
                 HirInstructionKind::FieldAssign(dest, root, fields) => {
                     let mut indices = Vec::new();
-                    let mut ty = dest.ty.as_ref().expect("no type");
+                    let mut ty = dest.getType();
                     for field in fields {
                         let className = ty.getName().expect("no name for field ref root");
                         let c = self.program.classes.get(&className).expect("class not found");
@@ -252,16 +264,16 @@ impl<'a> Builder<'a> {
                 MirFunctionKind::UserDefined(blocks)
             }
             FunctionKind::VariantCtor(i) => {
-                if self.function.name.base() == getTrueName() {
+                if self.function.name.base() == *TRUE_NAME {
                     return None;
                 }
-                if self.function.name.base() == getFalseName() {
+                if self.function.name.base() == *FALSE_NAME {
                     return None;
                 }
                 MirFunctionKind::VariantCtor(i)
             }
             FunctionKind::Extern => {
-                if self.function.name.base() == getNativePtrToRefName() {
+                if self.function.name.base() == *NATIVE_PTR_TO_REF_NAME {
                     return None;
                 }
                 MirFunctionKind::Extern
@@ -300,17 +312,17 @@ pub fn lowerType(ty: &HirType, program: &HirProgram) -> MirType {
     match ty {
         HirType::Named(name, _, _) => {
             if program.classes.get(name).is_some() {
-                if name.base() == getIntTypeName() {
+                if name.base() == *INT_TYPE_NAME {
                     MirType::Int64
-                } else if name.base() == getU8TypeName() {
+                } else if name.base() == *U8_TYPE_NAME {
                     MirType::UInt8
-                } else if name.base() == getI32TypeName() {
+                } else if name.base() == *I32_TYPE_NAME {
                     MirType::Int32
                 } else {
                     MirType::Struct(convertName(name))
                 }
             } else {
-                if name.base() == getBoolTypeName() {
+                if name.base() == *BOOL_TYPE_NAME {
                     MirType::Int64
                 } else {
                     MirType::Union(convertName(name))
@@ -371,10 +383,10 @@ pub fn lowerProgram(program: &HirProgram) -> MirProgram {
     //println!("Lowering classes");
 
     for (n, c) in &program.classes {
-        if n.base() == getIntTypeName() {
+        if n.base() == *INT_TYPE_NAME {
             continue;
         }
-        if n.base() == getU8TypeName() {
+        if n.base() == *U8_TYPE_NAME {
             continue;
         }
         let c = lowerClass(c, program);
@@ -384,7 +396,7 @@ pub fn lowerProgram(program: &HirProgram) -> MirProgram {
     //println!("Lowering enums");
 
     for (n, e) in &program.enums {
-        if n.base() == getBoolTypeName() {
+        if n.base() == *BOOL_TYPE_NAME {
             continue;
         }
         let u = lowerEnum(e, program);
@@ -1,7 +1,8 @@
 use std::{
     collections::{BTreeMap, BTreeSet},
     fs::File,
-    io::{self, Write},
+    io::{self, BufWriter, Write},
+    sync::LazyLock,
 };
 
 use crate::siko::{
@@ -24,6 +25,74 @@ use super::{
     Type::Type,
 };
 
+// mangled name prefixes of the extern functions, computed once instead of
+// rebuilding every qualified name on each dispatch check
+struct ExternPrefixes {
+    intAdd: String,
+    intClone: String,
+    intDiv: String,
+    intEq: String,
+    intLessThan: String,
+    intMod: String,
+    intMul: String,
+    intSub: String,
+    intToU8: String,
+    nativePtrAllocateArray: String,
+    nativePtrClone: String,
+    nativePtrDeallocate: String,
+    nativePtrEq: String,
+    nativePtrIsNull: String,
+    nativePtrLoad: String,
+    nativePtrMemcmp: String,
+    nativePtrMemcpy: String,
+    nativePtrNull: String,
+    nativePtrOffset: String,
+    nativePtrPrint: String,
+    nativePtrStore: String,
+    stdBasicUtilAbort: String,
+    stdBasicUtilPrintStr: String,
+    u8Add: String,
+    u8Clone: String,
+    u8Div: String,
+    u8Eq: String,
+    u8LessThan: String,
+    u8Mul: String,
+    u8Sub: String,
+}
+
+static EXTERN_PREFIXES: LazyLock<ExternPrefixes> = LazyLock::new(|| ExternPrefixes {
+    intAdd: getIntAddName().toString().replace(".", "_"),
+    intClone: getIntCloneName().toString().replace(".", "_"),
+    intDiv: getIntDivName().toString().replace(".", "_"),
+    intEq: getIntEqName().toString().replace(".", "_"),
+    intLessThan: getIntLessThanName().toString().replace(".", "_"),
+    intMod: getIntModName().toString().replace(".", "_"),
+    intMul: getIntMulName().toString().replace(".", "_"),
+    intSub: getIntSubName().toString().replace(".", "_"),
+    intToU8: getIntToU8Name().toString().replace(".", "_"),
+    nativePtrAllocateArray: getNativePtrAllocateArrayName().toString().replace(".", "_"),
+    nativePtrClone: getNativePtrCloneName().toString().replace(".", "_"),
+    nativePtrDeallocate: getNativePtrDeallocateName().toString().replace(".", "_"),
+    nativePtrEq: getNativePtrEqName().toString().replace(".", "_"),
+    nativePtrIsNull: getNativePtrIsNullName().toString().replace(".", "_"),
+    nativePtrLoad: getNativePtrLoadName().toString().replace(".", "_"),
+    nativePtrMemcmp: getNativePtrMemcmpName().toString().replace(".", "_"),
+    nativePtrMemcpy: getNativePtrMemcpyName().toString().replace(".", "_"),
+    nativePtrNull: getNativePtrNullName().toString().replace(".", "_"),
+    nativePtrOffset: getNativePtrOffsetName().toString().replace(".", "_"),
+    nativePtrPrint: getNativePtrPrintName().toString().replace(".", "_"),
+    nativePtrStore: getNativePtrStoreName().toString().replace(".", "_"),
+    stdBasicUtilAbort: getStdBasicUtilAbortName().toString().replace(".", "_"),
+    stdBasicUtilPrintStr: getStdBasicUtilPrintStrName().toString().replace(".", "_"),
+    u8Add: getU8AddName().toString().replace(".", "_"),
+    u8Clone: getU8CloneName().toString().replace(".", "_"),
+    u8Div: getU8DivName().toString().replace(".", "_"),
+    u8Eq: getU8EqName().toString().replace(".", "_"),
+    u8LessThan: getU8LessThanName().toString().replace(".", "_"),
+    u8Mul: getU8MulName().toString().replace(".", "_"),
+    u8Sub: getU8SubName().toString().replace(".", "_"),
+});
+
 pub struct MiniCGenerator {
     fileName: String,
     program: Program,
@@ -67,7 +136,7 @@ impl MiniCGenerator {
         }
     }
 
-    fn dumpStruct(&self, s: &Struct, buf: &mut File) -> io::Result<()> {
+    fn dumpStruct(&self, s: &Struct, buf: &mut BufWriter<File>) -> io::Result<()> {
         let name = getStructName(&s.name);
         writeln!(buf, "struct {} {{", name)?;
         for (index, field) in s.fields.iter().enumerate() {
@@ -213,7 +282,7 @@ impl MiniCGenerator {
         Some(s)
     }
 
-    fn dumpFunction(&self, f: &Function, buf: &mut File) -> io::Result<()> {
+    fn dumpFunction(&self, f: &Function, buf: &mut BufWriter<File>) -> io::Result<()> {
         let mut args = Vec::new();
         let mut argNames = Vec::new();
         for arg in &f.args {
@@ -263,9 +332,7 @@ impl MiniCGenerator {
             }
         }
 
-        if f.name
-            .starts_with(&getNativePtrMemcpyName().toString().replace(".", "_"))
-        {
+        if f.name.starts_with(&EXTERN_PREFIXES.nativePtrMemcpy) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    {} result;", getTypeName(&f.result))?;
             writeln!(buf, "    memcpy(dest, src, sizeof(*src) * count);")?;
@@ -273,23 +340,19 @@ impl MiniCGenerator {
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name
-            .starts_with(&getNativePtrMemcmpName().toString().replace(".", "_"))
-        {
+        if f.name.starts_with(&EXTERN_PREFIXES.nativePtrMemcmp) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    return memcmp(dest, src, sizeof(*src) * count);")?;
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name.starts_with(&getNativePtrNullName().toString().replace(".", "_")) {
+        if f.name.starts_with(&EXTERN_PREFIXES.nativePtrNull) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    return NULL;")?;
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name
-            .starts_with(&getNativePtrAllocateArrayName().toString().replace(".", "_"))
-        {
+        if f.name.starts_with(&EXTERN_PREFIXES.nativePtrAllocateArray) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(
                 buf,
@@ -299,9 +362,7 @@ impl MiniCGenerator {
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name
-            .starts_with(&getNativePtrDeallocateName().toString().replace(".", "_"))
-        {
+        if f.name.starts_with(&EXTERN_PREFIXES.nativePtrDeallocate) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    {} result;", getTypeName(&f.result))?;
             writeln!(buf, "    free(addr);")?;
@@ -309,25 +370,19 @@ impl MiniCGenerator {
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name
-            .starts_with(&getNativePtrOffsetName().toString().replace(".", "_"))
-        {
+        if f.name.starts_with(&EXTERN_PREFIXES.nativePtrOffset) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    return &base[count];")?;
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name
-            .starts_with(&getNativePtrCloneName().toString().replace(".", "_"))
-        {
+        if f.name.starts_with(&EXTERN_PREFIXES.nativePtrClone) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    return *addr;")?;
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name
-            .starts_with(&getNativePtrStoreName().toString().replace(".", "_"))
-        {
+        if f.name.starts_with(&EXTERN_PREFIXES.nativePtrStore) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    {} result;", getTypeName(&f.result))?;
             writeln!(buf, "    *addr = item;")?;
@@ -335,15 +390,13 @@ impl MiniCGenerator {
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name.starts_with(&getNativePtrLoadName().toString().replace(".", "_")) {
+        if f.name.starts_with(&EXTERN_PREFIXES.nativePtrLoad) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    return *addr;")?;
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name
-            .starts_with(&getNativePtrPrintName().toString().replace(".", "_"))
-        {
+        if f.name.starts_with(&EXTERN_PREFIXES.nativePtrPrint) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    {} result;", getTypeName(&f.result))?;
             writeln!(buf, "    printf(\"%p\\n\", addr);")?;
@@ -351,127 +404,121 @@ impl MiniCGenerator {
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name
-            .starts_with(&getNativePtrIsNullName().toString().replace(".", "_"))
-        {
+        if f.name.starts_with(&EXTERN_PREFIXES.nativePtrIsNull) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    return addr == NULL;")?;
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name.starts_with(&getNativePtrEqName().toString().replace(".", "_")) {
+        if f.name.starts_with(&EXTERN_PREFIXES.nativePtrEq) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    return a == b;")?;
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name.starts_with(&getIntAddName().toString().replace(".", "_")) {
+        if f.name.starts_with(&EXTERN_PREFIXES.intAdd) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    return self + other;")?;
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name.starts_with(&getIntSubName().toString().replace(".", "_")) {
+        if f.name.starts_with(&EXTERN_PREFIXES.intSub) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    return self - other;")?;
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name.starts_with(&getIntMulName().toString().replace(".", "_")) {
+        if f.name.starts_with(&EXTERN_PREFIXES.intMul) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    return self * other;")?;
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name.starts_with(&getIntDivName().toString().replace(".", "_")) {
+        if f.name.starts_with(&EXTERN_PREFIXES.intDiv) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    return self / other;")?;
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name.starts_with(&getIntModName().toString().replace(".", "_")) {
+        if f.name.starts_with(&EXTERN_PREFIXES.intMod) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    return self % other;")?;
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name.starts_with(&getIntToU8Name().toString().replace(".", "_")) {
+        if f.name.starts_with(&EXTERN_PREFIXES.intToU8) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    return (uint8_t)*self;")?;
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name.starts_with(&getIntEqName().toString().replace(".", "_")) {
+        if f.name.starts_with(&EXTERN_PREFIXES.intEq) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    return *self == *other;")?;
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name.starts_with(&getIntLessThanName().toString().replace(".", "_")) {
+        if f.name.starts_with(&EXTERN_PREFIXES.intLessThan) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    return *self < *other;")?;
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name.starts_with(&getIntCloneName().toString().replace(".", "_")) {
+        if f.name.starts_with(&EXTERN_PREFIXES.intClone) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    return *self;")?;
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name.starts_with(&getU8AddName().toString().replace(".", "_")) {
+        if f.name.starts_with(&EXTERN_PREFIXES.u8Add) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    return self + other;")?;
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name.starts_with(&getU8SubName().toString().replace(".", "_")) {
+        if f.name.starts_with(&EXTERN_PREFIXES.u8Sub) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    return self - other;")?;
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name.starts_with(&getU8MulName().toString().replace(".", "_")) {
+        if f.name.starts_with(&EXTERN_PREFIXES.u8Mul) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    return self * other;")?;
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name.starts_with(&getU8DivName().toString().replace(".", "_")) {
+        if f.name.starts_with(&EXTERN_PREFIXES.u8Div) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    return self / other;")?;
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name.starts_with(&getU8EqName().toString().replace(".", "_")) {
+        if f.name.starts_with(&EXTERN_PREFIXES.u8Eq) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    return *self == *other;")?;
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name.starts_with(&getU8LessThanName().toString().replace(".", "_")) {
+        if f.name.starts_with(&EXTERN_PREFIXES.u8LessThan) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    return *self < *other;")?;
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name.starts_with(&getU8CloneName().toString().replace(".", "_")) {
+        if f.name.starts_with(&EXTERN_PREFIXES.u8Clone) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    return *self;")?;
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name
-            .starts_with(&getStdBasicUtilAbortName().toString().replace(".", "_"))
-        {
+        if f.name.starts_with(&EXTERN_PREFIXES.stdBasicUtilAbort) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    abort();")?;
             writeln!(buf, "}}\n")?;
         }
 
-        if f.name
-            .starts_with(&getStdBasicUtilPrintStrName().toString().replace(".", "_"))
-        {
+        if f.name.starts_with(&EXTERN_PREFIXES.stdBasicUtilPrintStr) {
             writeln!(buf, "{} {}({}) {{", getTypeName(&f.result), f.name, args.join(", "))?;
             writeln!(buf, "    {} result;", getTypeName(&f.result))?;
             writeln!(buf, "    printf(\"%.*s\\n\", (int)v->field1, v->field0);")?;
@@ -506,7 +553,7 @@ impl MiniCGenerator {
         Ok(())
     }
 
-    fn dumpFunctionDeclaration(&self, f: &Function, buf: &mut File) -> io::Result<()> {
+    fn dumpFunctionDeclaration(&self, f: &Function, buf: &mut BufWriter<File>) -> io::Result<()> {
         let mut args = Vec::new();
         for arg in &f.args {
             args.push(format!("{} {}", getTypeName(&arg.ty), arg.name,));
@@ -519,7 +566,9 @@ impl MiniCGenerator {
     }
 
     pub fn dump(&mut self) -> io::Result<()> {
-        let mut output = File::create(&self.fileName).expect("Failed to open llvm output");
+        let output = File::create(&self.fileName).expect("Failed to open llvm output");
+        // one buffered writer instead of a write syscall per generated line
+        let mut output = BufWriter::new(output);
 
         writeln!(output, "#include <stdlib.h>")?;
         writeln!(output, "#include <stdint.h>")?;
@@ -577,6 +626,7 @@ impl MiniCGenerator {
         writeln!(output, "   Main_main();")?;
         writeln!(output, "   return 0;")?;
         writeln!(output, "}}\n\n")?;
+        output.flush()?;
         Ok(())
     }
 }
@@ -62,6 +62,12 @@ impl Monomorphize for Type {
     }
 }
 
+impl<T: Monomorphize> Monomorphize for Box<T> {
+    fn process(&self, sub: &TypeSubstitution, mono: &mut Monomorphizer) -> Self {
+        Box::new(self.as_ref().process(sub, mono))
+    }
+}
+
 impl<T: Monomorphize> Monomorphize for Option<T> {
     fn process(&self, sub: &TypeSubstitution, mono: &mut Monomorphizer) -> Self {
         match self {
@@ -207,7 +213,7 @@ impl Monomorphize for Instruction {
                 }
             }
             InstructionKind::Drop(dest, dropVar) => {
-                let ty = dropVar.ty.apply(sub).unwrap();
+                let ty = *dropVar.ty.apply(sub).unwrap();
                 let monoName = mono.get_mono_name(&getAutoDropFnName(), &vec![ty.clone()]);
                 mono.addKey(Key::AutoDropFn(getAutoDropFnName(), ty.clone()));
                 InstructionKind::FunctionCall(dest.clone(), monoName, vec![dropVar.clone()])
@@ -529,11 +535,11 @@ impl<'a> Monomorphizer<'a> {
         let location = Location::empty();
 
         let mut dropVar = bodyBuilder.createTempValue(VariableName::DropVar, location.clone());
-        dropVar.ty = Some(ty.clone());
+        dropVar.ty = Some(Box::new(ty.clone()));
 
         let selfVar = Variable {
             value: VariableName::Arg("self".to_string()),
-            ty: Some(ty.clone()),
+            ty: Some(Box::new(ty.clone())),
             location: Location::empty(),
             index: 0,
         };
@@ -565,7 +571,7 @@ impl<'a> Monomorphizer<'a> {
                         let field =
                             builder.addTypedFieldRef(dropVar.clone(), f.name.clone(), location.clone(), f.ty.clone());
                         let mut dropRes = bodyBuilder.createTempValue(VariableName::AutoDropResult, location.clone());
-                        dropRes.ty = Some(Type::getUnitType());
+                        dropRes.ty = Some(Box::new(Type::getUnitType()));
                         let dropKind = InstructionKind::Drop(dropRes, field.clone());
                         builder.addInstruction(dropKind, location.clone());
                     }
@@ -589,7 +595,7 @@ impl<'a> Monomorphizer<'a> {
                             transformType,
                         );
                         let mut dropRes = bodyBuilder.createTempValue(VariableName::AutoDropResult, location.clone());
-                        dropRes.ty = Some(Type::getUnitType());
+                        dropRes.ty = Some(Box::new(Type::getUnitType()));
                         let dropKind = InstructionKind::Drop(dropRes, transformValue);
                         caseBuilder.addInstruction(dropKind, location.clone());
                         caseBuilder.addJump(contBuilder.getBlockId(), JumpDirection::Forward, location.clone());
@@ -605,7 +611,7 @@ impl<'a> Monomorphizer<'a> {
                     let field =
                         builder.addTypedTupleIndex(dropVar.clone(), index as i32, location.clone(), arg.clone());
                     let mut dropRes = bodyBuilder.createTempValue(VariableName::AutoDropResult, location.clone());
-                    dropRes.ty = Some(Type::getUnitType());
+                    dropRes.ty = Some(Box::new(Type::getUnitType()));
                     let dropKind = InstructionKind::Drop(dropRes, field);
                     builder.addInstruction(dropKind, location.clone());
                 }
@@ -614,7 +620,7 @@ impl<'a> Monomorphizer<'a> {
         }
 
         let mut unitValue = builder.addUnit(location.clone());
-        unitValue.ty = Some(Type::getUnitType());
+        unitValue.ty = Some(Box::new(Type::getUnitType()));
         builder.addReturn(unitValue, location);
 
         let dropFn = Function {
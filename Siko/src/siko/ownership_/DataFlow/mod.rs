@@ -1,4 +0,0 @@
-pub mod DataFlowProfile;
-pub mod DataFlowProfileBuilder;
-pub mod FunctionGroupProcessor;
-pub mod FunctionInferenceData;
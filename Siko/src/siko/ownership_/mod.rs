@@ -1,8 +0,0 @@
-pub mod BorrowChecker;
-pub mod DataFlow;
-pub mod DataGroups;
-pub mod DataLifetime;
-pub mod FunctionGroups;
-pub mod Instantiator;
-pub mod Path;
-pub mod Substitution;
@@ -1,7 +1,44 @@
+use std::sync::LazyLock;
+
 use crate::siko::location::Location::*;
 use crate::siko::parser::Error::*;
 use crate::siko::parser::Token::*;
 
+#[derive(Debug, Clone, Copy)]
+enum CharKind {
+    Identifier,
+    SingleCharToken,
+    Whitespace,
+    Other,
+}
+
+// 128-entry ASCII classification table, one indexed load in the main lexer
+// loop replaces the chain of range checks and single-char-token guards
+static CHAR_KINDS: [CharKind; 128] = buildCharKinds();
+
+const fn buildCharKinds() -> [CharKind; 128] {
+    let mut table = [CharKind::Other; 128];
+    let mut c = 0;
+    while c < 128 {
+        table[c] = match c as u8 as char {
+            'a'..='z' | 'A'..='Z' | '0'..='9' | '_' => CharKind::Identifier,
+            '(' | ')' | '{' | '}' | '[' | ']' | ':' | ',' | ';' | '@' | '&' | '+' | '*' => CharKind::SingleCharToken,
+            '\n' | '\t' | '\r' | ' ' => CharKind::Whitespace,
+            _ => CharKind::Other,
+        };
+        c += 1;
+    }
+    table
+}
+
+fn getCharKind(c: char) -> CharKind {
+    if (c as u32) < 128 {
+        CHAR_KINDS[c as usize]
+    } else {
+        CharKind::Other
+    }
+}
+
 fn isIdentifier(c: char) -> bool {
     match c {
         'a'..='z' | 'A'..='Z' | '0'..='9' | '_' => true,
@@ -16,24 +53,76 @@ fn isInteger(c: char) -> bool {
     }
 }
 
+static KEYWORDS: &[(&str, Token)] = &[
+    ("_", Token::Misc(MiscKind::Wildcard)),
+    ("and", Token::Op(OperatorKind::And)),
+    ("as", Token::Keyword(KeywordKind::As)),
+    ("break", Token::Keyword(KeywordKind::Break)),
+    ("class", Token::Keyword(KeywordKind::Class)),
+    ("continue", Token::Keyword(KeywordKind::Continue)),
+    ("derive", Token::Keyword(KeywordKind::Derive)),
+    ("effect", Token::Keyword(KeywordKind::Effect)),
+    ("else", Token::Keyword(KeywordKind::Else)),
+    ("enum", Token::Keyword(KeywordKind::Enum)),
+    ("extern", Token::Keyword(KeywordKind::Extern)),
+    ("fn", Token::Keyword(KeywordKind::Fn)),
+    ("for", Token::Keyword(KeywordKind::For)),
+    ("if", Token::Keyword(KeywordKind::If)),
+    ("implicit", Token::Keyword(KeywordKind::Implicit)),
+    ("import", Token::Keyword(KeywordKind::Import)),
+    ("in", Token::Keyword(KeywordKind::In)),
+    ("instance", Token::Keyword(KeywordKind::Instance)),
+    ("let", Token::Keyword(KeywordKind::Let)),
+    ("loop", Token::Keyword(KeywordKind::Loop)),
+    ("match", Token::Keyword(KeywordKind::Match)),
+    ("module", Token::Keyword(KeywordKind::Module)),
+    ("mut", Token::Keyword(KeywordKind::Mut)),
+    ("or", Token::Op(OperatorKind::Or)),
+    ("pub", Token::Keyword(KeywordKind::Pub)),
+    ("return", Token::Keyword(KeywordKind::Return)),
+    ("self", Token::Keyword(KeywordKind::ValueSelf)),
+    ("trait", Token::Keyword(KeywordKind::Trait)),
+    ("type", Token::Keyword(KeywordKind::Type)),
+    ("while", Token::Keyword(KeywordKind::While)),
+];
+
+// the table is sorted, identifiers are classified with a single binary search
+// instead of a linear chain of string comparisons
+fn getKeywordToken(s: &str) -> Option<Token> {
+    match KEYWORDS.binary_search_by(|(k, _)| k.cmp(&s)) {
+        Ok(index) => Some(KEYWORDS[index].1.clone()),
+        Err(_) => None,
+    }
+}
+
+// single char tokens are built once here and handed out by lookup,
+// the main loop no longer reconstructs them through a match per character
+static SINGLE_CHAR_TOKENS: LazyLock<[Option<Token>; 128]> = LazyLock::new(buildSingleCharTokens);
+
+fn buildSingleCharTokens() -> [Option<Token>; 128] {
+    let mut table = [const { None }; 128];
+    table[b'(' as usize] = Some(Token::LeftBracket(BracketKind::Paren));
+    table[b')' as usize] = Some(Token::RightBracket(BracketKind::Paren));
+    table[b'{' as usize] = Some(Token::LeftBracket(BracketKind::Curly));
+    table[b'}' as usize] = Some(Token::RightBracket(BracketKind::Curly));
+    table[b'[' as usize] = Some(Token::LeftBracket(BracketKind::Square));
+    table[b']' as usize] = Some(Token::RightBracket(BracketKind::Square));
+    table[b':' as usize] = Some(Token::Misc(MiscKind::Colon));
+    table[b',' as usize] = Some(Token::Misc(MiscKind::Comma));
+    table[b';' as usize] = Some(Token::Misc(MiscKind::Semicolon));
+    table[b'@' as usize] = Some(Token::Misc(MiscKind::At));
+    table[b'&' as usize] = Some(Token::Misc(MiscKind::Ampersand));
+    table[b'+' as usize] = Some(Token::Op(OperatorKind::Add));
+    table[b'*' as usize] = Some(Token::Op(OperatorKind::Mul));
+    table
+}
+
 fn getSingleCharToken(c: char) -> Option<Token> {
-    let token = match c {
-        '(' => Token::LeftBracket(BracketKind::Paren),
-        ')' => Token::RightBracket(BracketKind::Paren),
-        '{' => Token::LeftBracket(BracketKind::Curly),
-        '}' => Token::RightBracket(BracketKind::Curly),
-        '[' => Token::LeftBracket(BracketKind::Square),
-        ']' => Token::RightBracket(BracketKind::Square),
-        ':' => Token::Misc(MiscKind::Colon),
-        ',' => Token::Misc(MiscKind::Comma),
-        ';' => Token::Misc(MiscKind::Semicolon),
-        '@' => Token::Misc(MiscKind::At),
-        '&' => Token::Misc(MiscKind::Ampersand),
-        '+' => Token::Op(OperatorKind::Add),
-        '*' => Token::Op(OperatorKind::Mul),
-        _ => return None,
-    };
-    Some(token)
+    if (c as u32) < 128 {
+        SINGLE_CHAR_TOKENS[c as usize].clone()
+    } else {
+        None
+    }
 }
 pub struct Lexer {
     content: Vec<char>,
@@ -65,11 +154,7 @@ impl Lexer {
     }
 
     fn peek(&self) -> Option<char> {
-        if self.index < self.content.len() {
-            Some(self.content[self.index])
-        } else {
-            None
-        }
+        self.content.get(self.index).copied()
     }
 
     fn step(&mut self) {
@@ -113,19 +198,21 @@ impl Lexer {
     fn processIdentifier(&mut self, c: char) {
         let startsWithInteger = isInteger(c);
         let startsWithUpperCase = c.is_uppercase();
-        self.current.push(c);
+        // scan to the end of the identifier first and build the string from
+        // the input slice in one go instead of growing it char by char
+        let start = self.index;
         self.step();
-        loop {
-            match self.peek() {
-                Some(c) if isIdentifier(c) => {
-                    self.current.push(c);
-                    self.step();
-                }
-                _ => {
-                    break;
-                }
-            }
+        // identifier characters never contain newlines, so scan with a local
+        // index and write the position and span back once at the end instead
+        // of stepping per character
+        let mut index = self.index;
+        while index < self.content.len() && isIdentifier(self.content[index]) {
+            index += 1;
         }
+        self.position.offset += (index - self.index) as i64;
+        self.index = index;
+        self.span.end = self.position.clone();
+        self.current = self.content[start..self.index].iter().collect();
         if startsWithInteger {
             let mut invalidLiteral = false;
             for c in self.current.chars() {
@@ -149,38 +236,9 @@ impl Lexer {
                 };
                 self.addToken(token);
             } else {
-                let token = match self.current.as_ref() {
-                    "module" => Token::Keyword(KeywordKind::Module),
-                    "class" => Token::Keyword(KeywordKind::Class),
-                    "enum" => Token::Keyword(KeywordKind::Enum),
-                    "fn" => Token::Keyword(KeywordKind::Fn),
-                    "import" => Token::Keyword(KeywordKind::Import),
-                    "if" => Token::Keyword(KeywordKind::If),
-                    "else" => Token::Keyword(KeywordKind::Else),
-                    "for" => Token::Keyword(KeywordKind::For),
-                    "in" => Token::Keyword(KeywordKind::In),
-                    "while" => Token::Keyword(KeywordKind::While),
-                    "loop" => Token::Keyword(KeywordKind::Loop),
-                    "match" => Token::Keyword(KeywordKind::Match),
-                    "let" => Token::Keyword(KeywordKind::Let),
-                    "derive" => Token::Keyword(KeywordKind::Derive),
-                    "extern" => Token::Keyword(KeywordKind::Extern),
-                    "trait" => Token::Keyword(KeywordKind::Trait),
-                    "instance" => Token::Keyword(KeywordKind::Instance),
-                    "effect" => Token::Keyword(KeywordKind::Effect),
-                    "self" => Token::Keyword(KeywordKind::ValueSelf),
-                    "mut" => Token::Keyword(KeywordKind::Mut),
-                    "return" => Token::Keyword(KeywordKind::Return),
-                    "continue" => Token::Keyword(KeywordKind::Continue),
-                    "break" => Token::Keyword(KeywordKind::Break),
-                    "implicit" => Token::Keyword(KeywordKind::Implicit),
-                    "type" => Token::Keyword(KeywordKind::Type),
-                    "pub" => Token::Keyword(KeywordKind::Pub),
-                    "as" => Token::Keyword(KeywordKind::As),
-                    "and" => Token::Op(OperatorKind::And),
-                    "or" => Token::Op(OperatorKind::Or),
-                    "_" => Token::Misc(MiscKind::Wildcard),
-                    _ => Token::VarIdentifier(self.current.clone()),
+                let token = match getKeywordToken(self.current.as_ref()) {
+                    Some(token) => token,
+                    None => Token::VarIdentifier(self.current.clone()),
                 };
                 self.addToken(token);
             }
@@ -317,97 +375,96 @@ impl Lexer {
     pub fn lex(&mut self, addEOF: bool) -> (Vec<TokenInfo>, Vec<LexerError>) {
         loop {
             match self.peek() {
-                Some(c) if isIdentifier(c) => self.processIdentifier(c),
-                Some(c) if getSingleCharToken(c).is_some() => self.processSingle(c),
-                Some(c) => match c {
-                    '\n' => self.ignore(),
-                    '\t' => self.ignore(),
-                    '\r' => self.ignore(),
-                    ' ' => self.ignore(),
-                    '/' => {
-                        self.step();
-                        match self.peek() {
-                            Some('/') => loop {
-                                match self.peek() {
-                                    Some('\n') => break,
-                                    None => break,
-                                    _ => self.ignore(),
-                                }
-                            },
-                            _ => self.addToken(Token::Op(OperatorKind::Div)),
-                        }
-                    }
-                    '-' => {
-                        self.step();
-                        match self.peek() {
-                            Some('>') => {
-                                self.step();
-                                self.addToken(Token::Arrow(ArrowKind::Right))
+                Some(c) => match getCharKind(c) {
+                    CharKind::Identifier => self.processIdentifier(c),
+                    CharKind::SingleCharToken => self.processSingle(c),
+                    CharKind::Whitespace => self.ignore(),
+                    CharKind::Other => match c {
+                        '/' => {
+                            self.step();
+                            match self.peek() {
+                                Some('/') => loop {
+                                    match self.peek() {
+                                        Some('\n') => break,
+                                        None => break,
+                                        _ => self.ignore(),
+                                    }
+                                },
+                                _ => self.addToken(Token::Op(OperatorKind::Div)),
                             }
-                            _ => self.addToken(Token::Op(OperatorKind::Sub)),
                         }
-                    }
-                    '>' => {
-                        self.step();
-                        match self.peek() {
-                            Some('=') => {
-                                self.step();
-                                self.addToken(Token::Op(OperatorKind::GreaterThanOrEqual))
+                        '-' => {
+                            self.step();
+                            match self.peek() {
+                                Some('>') => {
+                                    self.step();
+                                    self.addToken(Token::Arrow(ArrowKind::Right))
+                                }
+                                _ => self.addToken(Token::Op(OperatorKind::Sub)),
                             }
-                            _ => self.addToken(Token::Op(OperatorKind::GreaterThan)),
                         }
-                    }
-                    '<' => {
-                        self.step();
-                        match self.peek() {
-                            Some('=') => {
-                                self.step();
-                                self.addToken(Token::Op(OperatorKind::LessThanOrEqual))
+                        '>' => {
+                            self.step();
+                            match self.peek() {
+                                Some('=') => {
+                                    self.step();
+                                    self.addToken(Token::Op(OperatorKind::GreaterThanOrEqual))
+                                }
+                                _ => self.addToken(Token::Op(OperatorKind::GreaterThan)),
                             }
-                            _ => self.addToken(Token::Op(OperatorKind::LessThan)),
                         }
-                    }
-                    '=' => {
-                        self.step();
-                        match self.peek() {
-                            Some('=') => {
-                                self.step();
-                                self.addToken(Token::Op(OperatorKind::Equal))
+                        '<' => {
+                            self.step();
+                            match self.peek() {
+                                Some('=') => {
+                                    self.step();
+                                    self.addToken(Token::Op(OperatorKind::LessThanOrEqual))
+                                }
+                                _ => self.addToken(Token::Op(OperatorKind::LessThan)),
                             }
-                            Some('>') => {
-                                self.step();
-                                self.addToken(Token::Arrow(ArrowKind::DoubleRight))
+                        }
+                        '=' => {
+                            self.step();
+                            match self.peek() {
+                                Some('=') => {
+                                    self.step();
+                                    self.addToken(Token::Op(OperatorKind::Equal))
+                                }
+                                Some('>') => {
+                                    self.step();
+                                    self.addToken(Token::Arrow(ArrowKind::DoubleRight))
+                                }
+                                _ => self.addToken(Token::Misc(MiscKind::Equal)),
                             }
-                            _ => self.addToken(Token::Misc(MiscKind::Equal)),
                         }
-                    }
-                    '.' => {
-                        self.step();
-                        match self.peek() {
-                            Some('.') => {
-                                self.step();
-                                self.addToken(Token::Range(RangeKind::Exclusive))
+                        '.' => {
+                            self.step();
+                            match self.peek() {
+                                Some('.') => {
+                                    self.step();
+                                    self.addToken(Token::Range(RangeKind::Exclusive))
+                                }
+                                _ => self.addToken(Token::Misc(MiscKind::Dot)),
                             }
-                            _ => self.addToken(Token::Misc(MiscKind::Dot)),
                         }
-                    }
-                    '!' => {
-                        self.step();
-                        match self.peek() {
-                            Some('=') => {
-                                self.step();
-                                self.addToken(Token::Op(OperatorKind::NotEqual))
+                        '!' => {
+                            self.step();
+                            match self.peek() {
+                                Some('=') => {
+                                    self.step();
+                                    self.addToken(Token::Op(OperatorKind::NotEqual))
+                                }
+                                _ => self.addToken(Token::Misc(MiscKind::ExclamationMark)),
                             }
-                            _ => self.addToken(Token::Misc(MiscKind::ExclamationMark)),
                         }
-                    }
-                    '"' => {
-                        self.processString();
-                    }
-                    _ => {
-                        self.addError(LexerError::UnsupportedCharacter(c, self.span.clone()));
-                        self.step();
-                    }
+                        '"' => {
+                            self.processString();
+                        }
+                        _ => {
+                            self.addError(LexerError::UnsupportedCharacter(c, self.span.clone()));
+                            self.step();
+                        }
+                    },
                 },
                 None => break,
             }
@@ -415,6 +472,6 @@ impl Lexer {
         if addEOF {
             self.addToken(Token::EOF);
         }
-        (self.tokens.clone(), self.errors.clone())
+        (std::mem::take(&mut self.tokens), std::mem::take(&mut self.errors))
     }
 }
@@ -78,7 +78,7 @@ impl<'a> FunctionResolver<'a> {
                     let var = Variable {
                         value: VariableName::Arg(id.toString()),
                         location: id.location.clone(),
-                        ty: Some(typeResolver.resolveType(ty)),
+                        ty: Some(Box::new(typeResolver.resolveType(ty))),
                         index: 0,
                     };
                     env.addArg(var, *mutable);
@@ -89,7 +89,7 @@ impl<'a> FunctionResolver<'a> {
                         let var = Variable {
                             value: VariableName::Arg(format!("self")),
                             location: f.name.location.clone(),
-                            ty: Some(owner.clone()),
+                            ty: Some(Box::new(owner.clone())),
                             index: 0,
                         };
                         env.addArg(var, false);
@@ -102,7 +102,7 @@ impl<'a> FunctionResolver<'a> {
                         let var = Variable {
                             value: VariableName::Arg(format!("self")),
                             location: f.name.location.clone(),
-                            ty: Some(owner.clone()),
+                            ty: Some(Box::new(owner.clone())),
                             index: 0,
                         };
                         env.addArg(var, true);
@@ -115,7 +115,7 @@ impl<'a> FunctionResolver<'a> {
                         let var = Variable {
                             value: VariableName::Arg(format!("self")),
                             location: f.name.location.clone(),
-                            ty: Some(IrType::Reference(Box::new(owner.clone()), None)),
+                            ty: Some(Box::new(IrType::Reference(Box::new(owner.clone()), None))),
                             index: 0,
                         };
                         env.addArg(var, false);
@@ -61,9 +61,9 @@ pub struct Typechecker<'a> {
     traitMethodSelector: &'a TraitMethodSelector,
     allocator: TypeVarAllocator,
     substitution: TypeSubstitution,
-    types: BTreeMap<String, Type>,
+    types: BTreeMap<VariableName, Type>,
     selfType: Option<Type>,
-    mutables: BTreeSet<String>,
+    mutables: BTreeSet<VariableName>,
     mutableMethodCalls: BTreeMap<Variable, MutableMethodCallInfo>,
     fieldTypes: BTreeMap<Variable, Vec<Type>>,
     bodyBuilder: BodyBuilder,
@@ -130,14 +130,14 @@ impl<'a> Typechecker<'a> {
     fn initializeVar(&mut self, var: &Variable) {
         match &var.ty {
             Some(ty) => {
-                self.types.insert(var.value.to_string(), ty.clone());
+                self.types.insert(var.value.clone(), ty.as_ref().clone());
             }
             None => {
                 if let Some(ty) = self.bodyBuilder.getTypeInBody(&var) {
-                    self.types.insert(var.value.to_string(), ty.clone());
+                    self.types.insert(var.value.clone(), ty.clone());
                 } else {
                     let ty = self.allocator.next();
-                    self.types.insert(var.value.to_string(), ty.clone());
+                    self.types.insert(var.value.clone(), ty.clone());
                 }
             }
         }
@@ -148,13 +148,13 @@ impl<'a> Typechecker<'a> {
         for param in &self.f.params {
             match &param {
                 Parameter::Named(name, ty, mutable) => {
-                    self.types.insert(format!("{}", name), ty.clone());
+                    self.types.insert(VariableName::Arg(name.clone()), ty.clone());
                     if *mutable {
-                        self.mutables.insert(name.clone());
+                        self.mutables.insert(VariableName::Arg(name.clone()));
                     }
                 }
                 Parameter::SelfParam(mutable, ty) => {
-                    let name = format!("self");
+                    let name = VariableName::Arg(format!("self"));
                     self.types.insert(name.clone(), ty.clone());
                     self.selfType = Some(ty.clone());
                     if *mutable {
@@ -188,7 +188,7 @@ impl<'a> Typechecker<'a> {
                         InstructionKind::Bind(var, _, mutable) => {
                             self.initializeVar(var);
                             if *mutable {
-                                self.mutables.insert(var.value.to_string());
+                                self.mutables.insert(var.value.clone());
                             }
                         }
                         InstructionKind::Tuple(var, _) => {
@@ -204,20 +204,20 @@ impl<'a> Typechecker<'a> {
                             self.initializeVar(var);
                         }
                         InstructionKind::Return(var, _) => {
-                            self.types.insert(var.value.to_string(), Type::Never(false));
+                            self.types.insert(var.value.clone(), Type::Never(false));
                         }
                         InstructionKind::Ref(var, _) => {
                             self.initializeVar(var);
                         }
                         InstructionKind::Drop(_, _) => {}
                         InstructionKind::Jump(var, _, _) => {
-                            self.types.insert(var.value.to_string(), Type::Never(false));
+                            self.types.insert(var.value.clone(), Type::Never(false));
                         }
                         InstructionKind::Assign(_, _) => {}
                         InstructionKind::FieldAssign(_, _, _) => {}
                         InstructionKind::DeclareVar(var) => {
                             self.initializeVar(var);
-                            self.mutables.insert(var.value.to_string());
+                            self.mutables.insert(var.value.clone());
                         }
                         InstructionKind::Transform(var, _, _) => {
                             self.initializeVar(var);
@@ -234,7 +234,7 @@ impl<'a> Typechecker<'a> {
     }
 
     fn getType(&self, var: &Variable) -> Type {
-        match self.types.get(&var.value.to_string()) {
+        match self.types.get(&var.value) {
             Some(ty) => ty.clone(),
             None => panic!("No type found for {}!", var),
         }
@@ -530,8 +530,7 @@ impl<'a> Typechecker<'a> {
                 let targetFn = self.program.functions.get(&name).expect("Function not found");
                 let mut fnType = targetFn.getType();
 
-                let mutableCall =
-                    self.mutables.contains(&receiver.value.to_string()) && fnType.getResult().hasSelfType();
+                let mutableCall = self.mutables.contains(&receiver.value) && fnType.getResult().hasSelfType();
                 if mutableCall {
                     fnType = fnType.changeMethodResult();
                 }
@@ -609,13 +608,13 @@ impl<'a> Typechecker<'a> {
                 self.queue.push_back(*id);
             }
             InstructionKind::Assign(name, rhs) => {
-                if !self.mutables.contains(&name.value.to_string()) {
+                if !self.mutables.contains(&name.value) {
                     TypecheckerError::ImmutableAssign(instruction.location.clone()).report(self.ctx);
                 }
                 self.unify(self.getType(name), self.getType(rhs), instruction.location.clone());
             }
             InstructionKind::FieldAssign(name, rhs, fields) => {
-                if !self.mutables.contains(&name.value.to_string()) {
+                if !self.mutables.contains(&name.value) {
                     TypecheckerError::ImmutableAssign(instruction.location.clone()).report(self.ctx);
                 }
                 let receiverType = self.getType(name);
@@ -782,8 +781,7 @@ impl<'a> Typechecker<'a> {
                                     .bodyBuilder
                                     .createTempValue(VariableName::ImplicitResult, var.location.clone());
                                 implicitResult.ty = var.ty.clone();
-                                self.types
-                                    .insert(implicitResult.value.to_string(), info.baseType.clone());
+                                self.types.insert(implicitResult.value.clone(), info.baseType.clone());
                                 varSwap.add(var.clone(), implicitResult.clone());
                                 let tupleTypes = info.selfLessType.getTupleTypes();
                                 let receiverTy = self.getType(&info.receiver);
@@ -802,7 +800,7 @@ impl<'a> Typechecker<'a> {
                                             .createTempValue(VariableName::ImplicitSelf, var.location.clone());
                                         implicitSelf.ty = info.receiver.ty.clone();
                                         implicitResult.index += 1;
-                                        self.types.insert(implicitSelf.value.to_string(), receiverTy.clone());
+                                        self.types.insert(implicitSelf.value.clone(), receiverTy.clone());
                                         let implicitSelfIndex = InstructionKind::TupleIndex(
                                             implicitSelf.clone(),
                                             implicitResult.clone(),
@@ -817,7 +815,7 @@ impl<'a> Typechecker<'a> {
                                             .bodyBuilder
                                             .createTempValue(VariableName::ImplicitResult, var.location.clone());
                                         resVar.ty = var.ty.clone();
-                                        self.types.insert(resVar.value.to_string(), tupleTypes[0].clone());
+                                        self.types.insert(resVar.value.clone(), tupleTypes[0].clone());
                                         implicitResult.index += 1;
                                         let resIndex =
                                             InstructionKind::TupleIndex(resVar.clone(), implicitResult.clone(), 1);
@@ -837,7 +835,7 @@ impl<'a> Typechecker<'a> {
                                             implicitResult.clone(),
                                             0,
                                         );
-                                        self.types.insert(implicitSelf.value.to_string(), receiverTy.clone());
+                                        self.types.insert(implicitSelf.value.clone(), receiverTy.clone());
                                         kinds.push(implicitSelfIndex);
                                         implicitSelf.index += 1;
                                         let assign =
@@ -850,7 +848,7 @@ impl<'a> Typechecker<'a> {
                                                 .createTempValue(VariableName::ImplicitResult, var.location.clone());
                                             resVar.ty = var.ty.clone();
                                             args.push(resVar.clone());
-                                            self.types.insert(resVar.value.to_string(), argType.clone());
+                                            self.types.insert(resVar.value.clone(), argType.clone());
                                             implicitResult.index += 1;
                                             let tupleIndexN = InstructionKind::TupleIndex(
                                                 resVar.clone(),
@@ -909,25 +907,21 @@ impl<'a> Typechecker<'a> {
     }
 
     fn addTypes(&mut self, f: &mut Function) {
-        let mut varSwap = VariableSubstitution::new();
-
+        // an instruction only needs the swaps for its own variables, so the
+        // body is typed in a single walk instead of a collect and an apply pass
         let body = &mut f.body.as_mut().unwrap();
 
         for block in &mut body.blocks {
             for instruction in &mut block.instructions {
                 let vars = instruction.kind.collectVariables();
+                let mut varSwap = VariableSubstitution::new();
                 for var in vars {
                     let ty = self.getType(&var);
                     let ty = ty.apply(&self.substitution);
                     let mut newVar = var.clone();
-                    newVar.ty = Some(ty.clone());
+                    newVar.ty = Some(Box::new(ty.clone()));
                     varSwap.add(var, newVar);
                 }
-            }
-        }
-
-        for block in &mut body.blocks {
-            for instruction in &mut block.instructions {
                 instruction.kind = instruction.kind.applyVar(&varSwap);
             }
         }
@@ -952,7 +946,7 @@ impl<'a> Typechecker<'a> {
                                 let mut dest = var.clone();
                                 dest.value = VariableName::ImplicitRef(tag.getId());
                                 let ty = Type::Reference(Box::new(self.getType(var)), None);
-                                self.types.insert(dest.value.to_string(), ty);
+                                self.types.insert(dest.value.clone(), ty);
                                 let kind = InstructionKind::Ref(dest.clone(), var.clone());
                                 dest.index += 1;
                                 sub.add(var.clone(), dest.clone());
@@ -997,7 +991,7 @@ impl<'a> Typechecker<'a> {
                                 } else {
                                     InstructionKind::FunctionCall(dest.clone(), getCloneFnName(), vec![var.clone()])
                                 };
-                                self.types.insert(dest.value.to_string(), ty);
+                                self.types.insert(dest.value.clone(), ty);
                                 sub.add(var.clone(), dest.clone());
                                 builder.addInstruction(kind, instruction.location.clone());
                                 builder.step();
@@ -1032,7 +1026,7 @@ impl<'a> Typechecker<'a> {
                                     ImplicitConvertInfo::Simple(targetTy) => {
                                         let mut dest = var.clone();
                                         dest.value = VariableName::ImplicitConvert(tag.getId());
-                                        self.types.insert(dest.value.to_string(), targetTy.clone());
+                                        self.types.insert(dest.value.clone(), targetTy.clone());
                                         let kind = InstructionKind::FunctionCall(
                                             dest.clone(),
                                             getImplicitConvertFnName(),
@@ -1045,13 +1039,12 @@ impl<'a> Typechecker<'a> {
                                     ImplicitConvertInfo::Ref(targetTy) => {
                                         let mut implicitConvertDest = var.clone();
                                         implicitConvertDest.value = VariableName::ImplicitConvert(tag.getId());
-                                        self.types
-                                            .insert(implicitConvertDest.value.to_string(), targetTy.clone());
+                                        self.types.insert(implicitConvertDest.value.clone(), targetTy.clone());
 
                                         let mut implicitRefDest = var.clone();
                                         implicitRefDest.value = VariableName::ImplicitRef(tag.getId());
                                         self.types.insert(
-                                            implicitRefDest.value.to_string(),
+                                            implicitRefDest.value.clone(),
                                             Type::Reference(Box::new(targetTy.clone()), None),
                                         );
 
@@ -1123,8 +1116,8 @@ impl<'a> Typechecker<'a> {
         self.addImplicitConverts();
         self.transformMutableMethodCalls();
 
-        let mut result = self.f.clone();
-        result.body = Some(self.bodyBuilder.build());
+        // copy the function header only, the old body is replaced anyway
+        let mut result = self.f.copyWithBody(Some(self.bodyBuilder.build()));
         if let Some(selfType) = self.selfType.clone() {
             result.result = result.result.changeSelfType(selfType);
         }
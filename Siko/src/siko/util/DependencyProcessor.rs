@@ -15,12 +15,14 @@ impl<T: Debug> Debug for DependencyGroup<T> {
 fn createIdMaps<T: Ord + Clone>(
     graph: &mut Graph,
     all_dependencies: &BTreeMap<T, Vec<T>>,
-) -> (BTreeMap<SCC::NodeId, T>, BTreeMap<T, SCC::NodeId>) {
-    let mut id_item_map = BTreeMap::new();
+) -> (Vec<T>, BTreeMap<T, SCC::NodeId>) {
+    // node ids are handed out densely, so the id -> item direction is a flat
+    // vector indexed by the id instead of another map
+    let mut id_item_map = Vec::with_capacity(all_dependencies.len());
     let mut item_id_map = BTreeMap::new();
     for key in all_dependencies.keys() {
         let id = graph.addNode();
-        id_item_map.insert(id, key.clone());
+        id_item_map.push(key.clone());
         item_id_map.insert(key.clone(), id);
     }
     (id_item_map, item_id_map)
@@ -49,7 +51,7 @@ pub fn processDependencies<T: Ord + Clone>(all_dependencies: &BTreeMap<T, Vec<T>
     for scc in sccs {
         let mut items = Vec::new();
         for i in scc {
-            items.push(id_item_map.get(&i).unwrap().clone());
+            items.push(id_item_map[i.value()].clone());
         }
         let group = DependencyGroup { items: items };
         ordered_groups.push(group);
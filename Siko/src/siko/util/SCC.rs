@@ -3,6 +3,12 @@ pub struct NodeId {
     value: usize,
 }
 
+impl NodeId {
+    pub fn value(&self) -> usize {
+        self.value
+    }
+}
+
 #[derive(Debug, Clone)]
 pub struct Node {
     id: NodeId,
@@ -90,31 +96,40 @@ impl Graph {
     }
 
     fn dfs(&mut self, nodeId: NodeId) {
-        let node = self.getNode(nodeId);
-        let neighbours = node.neighbours.clone();
-        if node.lowLink != None {
+        if self.nodes[nodeId.value].lowLink != None {
             return;
         }
+        // iterative depth first search with an explicit work stack, the
+        // recursive version created one call frame per node and overflowed
+        // on deep dependency chains
         self.initNode(nodeId);
         self.pushToStack(nodeId);
-        for n in neighbours {
-            self.checkNode(nodeId, n);
-        }
-        if self.startOfSCC(nodeId) {
-            self.createSCC(nodeId);
-        }
-    }
-
-    fn checkNode(&mut self, current: NodeId, neighbourId: NodeId) {
-        let neighbourNode = self.getNode(neighbourId).clone();
-        if neighbourNode.isVisited() {
-            if neighbourNode.onStack {
-                self.updateLowLink(current, neighbourNode.index);
+        let mut work = vec![(nodeId, 0)];
+        while let Some((current, index)) = work.last().copied() {
+            if index < self.nodes[current.value].neighbours.len() {
+                work.last_mut().unwrap().1 += 1;
+                let neighbourId = self.nodes[current.value].neighbours[index];
+                let neighbourNode = &self.nodes[neighbourId.value];
+                if neighbourNode.isVisited() {
+                    if neighbourNode.onStack {
+                        let neighbourIndex = neighbourNode.index;
+                        self.updateLowLink(current, neighbourIndex);
+                    }
+                } else {
+                    self.initNode(neighbourId);
+                    self.pushToStack(neighbourId);
+                    work.push((neighbourId, 0));
+                }
+            } else {
+                work.pop();
+                if self.startOfSCC(current) {
+                    self.createSCC(current);
+                }
+                if let Some((parent, _)) = work.last().copied() {
+                    let lowLink = self.nodes[current.value].lowLink.unwrap();
+                    self.updateLowLink(parent, lowLink);
+                }
             }
-        } else {
-            self.dfs(neighbourId);
-            let neighbourNode = self.getNode(neighbourId).clone();
-            self.updateLowLink(current, neighbourNode.lowLink.unwrap());
         }
     }
 
@@ -126,7 +141,7 @@ impl Graph {
         for id in nodeIds {
             self.dfs(id);
         }
-        return self.sccs.clone();
+        return std::mem::take(&mut self.sccs);
     }
 
     pub fn addNode(&mut self) -> NodeId {
@@ -1,5 +1,6 @@
 #!/usr/bin/python3
 
+import concurrent.futures
 import os
 import subprocess
 import sys
@@ -16,26 +17,26 @@ def compileSikoLLVM(currentDir, files, extras):
     object_path = os.path.join(currentDir, "main.o")
     llvm_output_path = os.path.join(currentDir, "main.bin")
     args = ["./siko", "-o", output_path] + extras + files
-    r = subprocess.run(args)
+    r = subprocess.run(args, capture_output=True)
     if r.returncode != 0:
-        return None
-    r = subprocess.run(["opt", "-passes=verify", "-S", llvm_ir_output_path, "-o", "/dev/null"])
+        return (None, r.stdout + r.stderr)
+    r = subprocess.run(["opt", "-passes=verify", "-S", llvm_ir_output_path, "-o", "/dev/null"], capture_output=True)
     if r.returncode != 0:
-       return None
-    r = subprocess.run(["opt", "-O2", "-S", llvm_ir_output_path, "-o", optimized_path])
+        return (None, r.stdout + r.stderr)
+    r = subprocess.run(["opt", "-O2", "-S", llvm_ir_output_path, "-o", optimized_path], capture_output=True)
     if r.returncode != 0:
-       return None
-    r = subprocess.run(["llvm-as", optimized_path, "-o", bitcode_path])
+        return (None, r.stdout + r.stderr)
+    r = subprocess.run(["llvm-as", optimized_path, "-o", bitcode_path], capture_output=True)
     if r.returncode != 0:
-        return None
-    r = subprocess.run(["llc", "-O0", "-relocation-model=pic", bitcode_path, "-filetype=obj", "-o", object_path])
+        return (None, r.stdout + r.stderr)
+    r = subprocess.run(["llc", "-O0", "-relocation-model=pic", bitcode_path, "-filetype=obj", "-o", object_path], capture_output=True)
     if r.returncode != 0:
-        return None
-    r = subprocess.run(["clang", "-O0", object_path, "-o", llvm_output_path])
+        return (None, r.stdout + r.stderr)
+    r = subprocess.run(["clang", "-O0", object_path, "-o", llvm_output_path], capture_output=True)
     #r = subprocess.run(["rustc", output_path, "-o", rust_output_path])
     if r.returncode != 0:
-        return None
-    return llvm_output_path
+        return (None, r.stdout + r.stderr)
+    return (llvm_output_path, None)
 
 def compileSikoC(currentDir, files, extras):
     output_path = os.path.join(currentDir, "main")
@@ -43,65 +44,58 @@ def compileSikoC(currentDir, files, extras):
     object_path = os.path.join(currentDir, "main.o")
     bin_output_path = os.path.join(currentDir, "main.bin")
     args = ["./siko", "-o", output_path] + extras + files
-    r = subprocess.run(args)
+    r = subprocess.run(args, capture_output=True)
     if r.returncode != 0:
-        return None
-    r = subprocess.run(["clang", "-fsanitize=undefined,address", "-g", "-O1", "-c", c_output_path, "-o", object_path, "-I", "siko_runtime"])
+        return (None, r.stdout + r.stderr)
+    r = subprocess.run(["clang", "-fsanitize=undefined,address", "-g", "-O1", "-c", c_output_path, "-o", object_path, "-I", "siko_runtime"], capture_output=True)
     if r.returncode != 0:
-        return None
-    r = subprocess.run(["clang", "-fsanitize=undefined,address", object_path, "-o", bin_output_path])
+        return (None, r.stdout + r.stderr)
+    r = subprocess.run(["clang", "-fsanitize=undefined,address", object_path, "-o", bin_output_path], capture_output=True)
     #r = subprocess.run(["rustc", output_path, "-o", rust_output_path])
     if r.returncode != 0:
-        return None
-    return bin_output_path
+        return (None, r.stdout + r.stderr)
+    return (bin_output_path, None)
 
 def compare_output(output_txt_path, current_output):
     if os.path.exists(output_txt_path):
         with open(output_txt_path, "rb") as f:
             existing_output = f.read()
         if existing_output != current_output:
-            print(" - failed")
-            print("Expected:")
-            print(existing_output)
-            print("Got:")
-            print(current_output)
-            return False
-        return existing_output == current_output
+            detail = "Expected:\n%s\nGot:\n%s" % (existing_output, current_output)
+            return (False, detail)
+        return (True, None)
     else:
         with open(output_txt_path, "wb") as f:
             f.write(current_output)
-        return True
+        return (True, None)
 
 def test_success(root, entry, extras):
-    print("- %s" % entry, end='')
     currentDir = os.path.join(root, entry)
     skipPath = os.path.join(currentDir, "SKIP")
     if os.path.exists(skipPath):
-        return "skip"
+        return ("skip", None)
     inputPath = os.path.join(currentDir, "main.sk")
-    #binary = compileSikoLLVM(currentDir, [inputPath], extras)
-    binary = compileSikoC(currentDir, [inputPath], extras)
+    #(binary, detail) = compileSikoLLVM(currentDir, [inputPath], extras)
+    (binary, detail) = compileSikoC(currentDir, [inputPath], extras)
     if binary is None:
-        return False
+        return (False, detail)
     r = subprocess.run([binary], capture_output=True)
     if r.returncode != 0:
-        return False
+        return (False, r.stdout + r.stderr)
     output_txt_path = os.path.join(root, entry, "output.txt")
     return compare_output(output_txt_path, r.stdout + r.stderr)
 
 def test_fail(root, entry, extras):
-    print("- %s" % entry, end = '')
-    global success, failure, skipped
     skip_path = os.path.join(root, entry, "SKIP")
     if os.path.exists(skip_path):
-        return "skip"
+        return ("skip", None)
     input_path = os.path.join(root, entry, "main.sk")
     output_path = os.path.join(root, entry, "main.ll")
     args = ["./siko", input_path, "-o", output_path] + extras
     #print(args)
     r = subprocess.run(args, capture_output=True)
     if r.returncode == 0:
-        return False
+        return (False, None)
     output_txt_path = os.path.join(root, entry, "output.txt")
     return compare_output(output_txt_path, r.stdout + r.stderr)
 
@@ -115,17 +109,20 @@ errors_path = os.path.join(".", "test", "errors")
 
 failures = []
 
-def processResult(r, name):
+def processResult(result, name):
     global success, failure, skipped
+    (r, detail) = result
     if r == "skip":
-        print(" - SKIPPED")
+        print("- %s - SKIPPED" % name)
         skipped += 1
         return
     if r:
-        print(" - success")
+        print("- %s - success" % name)
         success += 1
     else:
-        print(" - failed")
+        print("- %s - failed" % name)
+        if detail:
+            print(detail)
         failure += 1
         failures.append(name)
 
@@ -136,21 +133,22 @@ def collect_tests(base_path):
             tests.append(root)
     return tests
 
-print("Success tests:")
-success_tests = collect_tests(successes_path)
-for test_path in success_tests:
-    entry = os.path.relpath(test_path, successes_path)
-    if filters and entry not in filters:
-        continue
-    processResult(test_success(successes_path, entry, ["std"]), entry)
-
-print("Error tests:")
-failed_tests = collect_tests(errors_path)
-for test_path in failed_tests:
-    entry = os.path.relpath(test_path, errors_path)
-    if len(filters) > 0 and entry not in filters:
-        continue
-    processResult(test_fail(errors_path, entry, ["std"]), entry)
+def run_tests(executor, runner, base_path, extras):
+    entries = []
+    for test_path in collect_tests(base_path):
+        entry = os.path.relpath(test_path, base_path)
+        if filters and entry not in filters:
+            continue
+        entries.append(entry)
+    results = [executor.submit(runner, base_path, entry, extras) for entry in entries]
+    for (entry, result) in zip(entries, results):
+        processResult(result.result(), entry)
+
+with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+    print("Success tests:")
+    run_tests(executor, test_success, successes_path, ["std"])
+    print("Error tests:")
+    run_tests(executor, test_fail, errors_path, ["std"])
 
 percent = 0
 if (success+failure) != 0: